@@ -1,3 +1,3 @@
-from .core import calculate_score_and_suggestions, strength_label
+from .core import calculate_many, calculate_score_and_suggestions, strength_label
 
-__all__ = ["calculate_score_and_suggestions", "strength_label"]
+__all__ = ["calculate_many", "calculate_score_and_suggestions", "strength_label"]
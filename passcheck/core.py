@@ -1,89 +1,275 @@
+import functools
+import hashlib
+import itertools
 import math
-
-
-def load_common_words(path: str = "common_words.txt") -> set[str]:
+import operator
+import os
+import re
+import string
+import threading
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+
+# Transitions keyed by node << 21 | ord(char), then per-node arrays of failure
+# links, word length ending at the node (0 if none) and dictionary links
+# (nearest failure-chain node that ends a word).
+_Automaton = tuple[dict[int, int], array, array, array]
+
+_LOWER = frozenset(string.ascii_lowercase)
+_UPPER = frozenset(string.ascii_uppercase)
+_DIGIT = frozenset(string.digits)
+_ALNUM = _LOWER | _UPPER | _DIGIT
+
+# log2 of every charset size estimate_entropy_bits can produce (sums of 26,
+# 26, 10 and 33 for the classes present).
+_LOG2_CHARSET = {
+    n: math.log2(n)
+    for n in {
+        lower * 26 + upper * 26 + digit * 10 + symbol * 33
+        for lower, upper, digit, symbol in itertools.product((0, 1), repeat=4)
+    }
+    if n
+}
+
+# Adds 128 to every ASCII byte, so byte differences fit in 1..255.
+_SHIFT_128 = bytes((i + 128) & 0xFF for i in range(256))
+
+# Scoring results keyed by a per-process keyed BLAKE2b digest of the resolved
+# word list path and the password, so repeat checks are cheap without keeping
+# plaintext passwords in memory or reusing results from another word list.
+_SCORE_CACHE_SIZE = 4096
+_SCORE_CACHE_KEY = os.urandom(16)
+_score_cache: OrderedDict[bytes, tuple[int, tuple[str, ...], tuple[str, ...], float]] = OrderedDict()
+_score_cache_lock = threading.Lock()
+
+# Below this many passwords, starting worker processes costs more than scoring.
+_PARALLEL_MIN_BATCH = 1000
+
+
+def _read_common_words(path: str) -> frozenset[str]:
     try:
         with open(path, "r", encoding="utf-8") as f:
-            return {
-                line.strip().lower()
-                for line in f
-                if line.strip() and not line.lstrip().startswith("#")
-            }
+            text = f.read()
     except FileNotFoundError:
-        return set()
+        return frozenset()
+
+    # Lowercase, split and strip in bulk; universal newlines already turned
+    # every line ending into "\n".
+    lines = map(str.strip, text.lower().split("\n"))
+    return frozenset(w for w in lines if w and not w.startswith("#"))
+
+
+def load_common_words(path: str = "common_words.txt") -> frozenset[str]:
+    # Cache per resolved file, so a relative path follows the current directory.
+    return _load_common_words_cached(os.path.abspath(path))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_common_words_cached(path: str) -> frozenset[str]:
+    return _read_common_words(path)
+
+
+_LEET_TABLE = str.maketrans({
+    "@": "a", "4": "a",
+    "8": "b",
+    "(": "c", "{": "c", "[": "c",
+    "3": "e",
+    "6": "g", "9": "g",
+    "1": "i", "!": "i", "|": "i",
+    "0": "o",
+    "$": "s", "5": "s",
+    "7": "t", "+": "t",
+    "2": "z",
+})
 
 
 def normalize_leetspeak(s: str) -> str:
-    table = str.maketrans({
-        "@": "a", "4": "a",
-        "8": "b",
-        "(": "c", "{": "c", "[": "c",
-        "3": "e",
-        "6": "g", "9": "g",
-        "1": "i", "!": "i", "|": "i",
-        "0": "o",
-        "$": "s", "5": "s",
-        "7": "t", "+": "t",
-        "2": "z",
-    })
-    return s.lower().translate(table)
-
-
-def find_dictionary_hits(password: str, common_words: set[str]) -> list[str]:
-    raw = password.lower()
-    norm = normalize_leetspeak(password)
-
-    hits: list[str] = []
-    for w in common_words:
+    return s.lower().translate(_LEET_TABLE)
+
+
+def _match_texts(lowered: str) -> tuple[str, ...]:
+    norm = lowered.translate(_LEET_TABLE)
+    return (lowered,) if norm == lowered else (lowered, norm)
+
+
+def _build_automaton(words: Iterable[str]) -> _Automaton:
+    goto: list[dict[str, int]] = [{}]
+    length = [0]
+    for w in words:
         if len(w) < 4:
             continue
-        if w in raw or w in norm:
-            hits.append(w)
+        node = 0
+        for c in w:
+            nxt = goto[node].get(c)
+            if nxt is None:
+                nxt = len(goto)
+                goto[node][c] = nxt
+                goto.append({})
+                length.append(0)
+            node = nxt
+        length[node] = len(w)
+
+    # Breadth-first so every failure target is finished before it is used.
+    fail = [0] * len(goto)
+    link = [0] * len(goto)
+    queue = deque(goto[0].values())
+    while queue:
+        node = queue.popleft()
+        for c, nxt in goto[node].items():
+            queue.append(nxt)
+            f = fail[node]
+            while f and c not in goto[f]:
+                f = fail[f]
+            f = fail[nxt] = goto[f].get(c, 0)
+            link[nxt] = f if length[f] else link[f]
+
+    # One flat transition table and typed arrays instead of a dict and three
+    # boxed ints per node: about half the memory for a 10k-word list.
+    edges = {
+        node << 21 | ord(c): nxt
+        for node, children in enumerate(goto)
+        for c, nxt in children.items()
+    }
+    return edges, array("i", fail), array("i", length), array("i", link)
+
+
+def _load_automaton(path: str = "common_words.txt") -> _Automaton:
+    return _load_automaton_cached(os.path.abspath(path))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_automaton_cached(path: str) -> _Automaton:
+    # Matched words are sliced back out of the password, so the automaton
+    # does not need the word strings kept alive once it is built.
+    return _build_automaton(_read_common_words(path))
+
+
+def _match_words(lowered: str, automaton: _Automaton) -> list[str]:
+    edges, fail, length, link = automaton
+    found: set[str] = set()
+    for text in _match_texts(lowered):
+        node = 0
+        for end, code in enumerate(map(ord, text), 1):
+            nxt = edges.get(node << 21 | code)
+            while nxt is None and node:
+                node = fail[node]
+                nxt = edges.get(node << 21 | code)
+            node = nxt or 0
+            m = node if length[node] else link[node]
+            while m:
+                found.add(text[end - length[m] : end])
+                m = link[m]
+
+    hits = list(found)
+    hits.sort(key=len, reverse=True)
+    return hits
+
+
+def find_dictionary_hits(password: str, common_words: Iterable[str]) -> list[str]:
+    if not isinstance(common_words, (set, frozenset)):
+        common_words = frozenset(common_words)
+    # Distinct word lengths, collected in one C-level pass over the words.
+    sizes = sorted(size for size in set(map(len, common_words)) if size >= 4)
+
+    found: set[str] = set()
+    for text in _match_texts(password.lower()):
+        for size in sizes:
+            if size > len(text):
+                break
+            windows = [text[i : i + size] for i in range(len(text) - size + 1)]
+            found.update(common_words.intersection(windows))
 
+    hits = list(found)
     hits.sort(key=len, reverse=True)
     return hits
 
 
-def estimate_entropy_bits(password: str) -> float:
+def _classify(password: str) -> tuple[bool, bool, bool, bool]:
+    if password.isascii():
+        # Set operations run in C; for ASCII they match the str.is*() checks.
+        chars = set(password)
+        return (
+            not _LOWER.isdisjoint(chars),
+            not _UPPER.isdisjoint(chars),
+            not _DIGIT.isdisjoint(chars),
+            not chars <= _ALNUM,
+        )
+
+    # Bits: 1 lower, 2 upper, 4 digit, 8 symbol; stop once all four are seen.
+    mask = 0
+    for c in password:
+        if c.islower():
+            mask |= 1
+        elif c.isupper():
+            mask |= 2
+        elif c.isdigit():
+            mask |= 4
+        if not c.isalnum():
+            mask |= 8
+        if mask == 15:
+            break
+    return bool(mask & 1), bool(mask & 2), bool(mask & 4), bool(mask & 8)
+
+
+def estimate_entropy_bits(
+    password: str, classes: tuple[bool, bool, bool, bool] | None = None
+) -> float:
+    if classes is None:
+        classes = _classify(password)
+    has_lower, has_upper, has_digit, has_symbol = classes
+
     charset = 0
-    if any(c.islower() for c in password):
+    if has_lower:
         charset += 26
-    if any(c.isupper() for c in password):
+    if has_upper:
         charset += 26
-    if any(c.isdigit() for c in password):
+    if has_digit:
         charset += 10
-    if any(not c.isalnum() for c in password):
+    if has_symbol:
         charset += 33
 
     if charset == 0:
         return 0.0
 
-    return len(password) * math.log2(charset)
+    return len(password) * _LOG2_CHARSET[charset]
 
 
 def has_simple_sequence(password: str, min_len: int = 4) -> bool:
     s = password.lower()
-    for i in range(len(s) - min_len + 1):
-        chunk = s[i : i + min_len]
-        diffs = [ord(chunk[j + 1]) - ord(chunk[j]) for j in range(min_len - 1)]
-        if all(d == 1 for d in diffs) or all(d == -1 for d in diffs):
+    if min_len <= 1:
+        return len(s) >= min_len
+
+    if s.isascii():
+        # Differences between neighbouring bytes (+128), so +1 steps become
+        # 0x81 and -1 steps 0x7f; the run search is then a C-level bytes find.
+        b = s.encode("ascii")
+        diffs = bytes(map(operator.sub, b[1:].translate(_SHIFT_128), b))
+        return b"\x81" * (min_len - 1) in diffs or b"\x7f" * (min_len - 1) in diffs
+
+    # Length of the current +1 / -1 step runs ending at each character.
+    up = down = 0
+    codes = [ord(c) for c in s]
+    for a, b in zip(codes, codes[1:]):
+        d = b - a
+        up = up + 1 if d == 1 else 0
+        down = down + 1 if d == -1 else 0
+        if up >= min_len - 1 or down >= min_len - 1:
             return True
     return False
 
 
+@functools.lru_cache(maxsize=None)
+def _run_pattern(run_len: int) -> re.Pattern[str]:
+    return re.compile(rf"(.)\1{{{run_len - 1}}}", re.DOTALL)
+
+
 def has_repeated_run(password: str, run_len: int = 4) -> bool:
     if run_len <= 1:
         return False
 
-    count = 1
-    for i in range(1, len(password)):
-        if password[i] == password[i - 1]:
-            count += 1
-            if count >= run_len:
-                return True
-        else:
-            count = 1
-    return False
+    return _run_pattern(run_len).search(password) is not None
 
 
 def strength_label(score: int) -> str:
@@ -97,27 +283,23 @@ def strength_label(score: int) -> str:
 
 
 def _dedupe_preserve_order(items: list[str]) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
-    for x in items:
-        if x not in seen:
-            seen.add(x)
-            out.append(x)
-    return out
+    return list(dict.fromkeys(items))
 
 
-def calculate_score_and_suggestions(password: str) -> tuple[int, list[str], list[str], float]:
+def _calculate_score_and_suggestions(password: str) -> tuple[int, list[str], list[str], float]:
     findings: list[str] = []
     suggestions: list[str] = []
 
     length = len(password)
-    entropy = estimate_entropy_bits(password)
+    classes = _classify(password)
+    entropy = estimate_entropy_bits(password, classes)
 
     score = 0
 
     # Dictionary check
-    common_words = load_common_words()
-    hits = find_dictionary_hits(password, common_words)
+    # Words are 4+ characters, so shorter input never needs the word list.
+    lowered = password.lower()
+    hits = _match_words(lowered, _load_automaton()) if len(lowered) >= 4 else []
     if hits:
         findings.append(f"Contains common word(s): {', '.join(hits[:3])}.")
         suggestions.append("Avoid common words or names")
@@ -145,12 +327,7 @@ def calculate_score_and_suggestions(password: str) -> tuple[int, list[str], list
         score += 40
 
     # Variety
-    has_lower = any(c.islower() for c in password)
-    has_upper = any(c.isupper() for c in password)
-    has_digit = any(c.isdigit() for c in password)
-    has_symbol = any(not c.isalnum() for c in password)
-
-    categories = sum([has_lower, has_upper, has_digit, has_symbol])
+    categories = sum(classes)
     findings.append(f"Character types used: {categories}/4.")
     score += categories * 10
 
@@ -181,3 +358,42 @@ def calculate_score_and_suggestions(password: str) -> tuple[int, list[str], list
 
     score = max(0, min(score, 100))
     return score, findings, _dedupe_preserve_order(suggestions), entropy
+
+
+def calculate_score_and_suggestions(password: str) -> tuple[int, list[str], list[str], float]:
+    digest = hashlib.blake2b(key=_SCORE_CACHE_KEY, digest_size=16)
+    digest.update(os.fsencode(os.path.abspath("common_words.txt")))
+    digest.update(b"\0")
+    digest.update(password.encode("utf-8", "surrogatepass"))
+    key = digest.digest()
+    with _score_cache_lock:
+        cached = _score_cache.get(key)
+        if cached is not None:
+            _score_cache.move_to_end(key)
+
+    if cached is None:
+        score, findings, suggestions, entropy = _calculate_score_and_suggestions(password)
+        cached = score, tuple(findings), tuple(suggestions), entropy
+        with _score_cache_lock:
+            _score_cache[key] = cached
+            if len(_score_cache) > _SCORE_CACHE_SIZE:
+                _score_cache.popitem(last=False)
+
+    score, findings, suggestions, entropy = cached
+    return score, list(findings), list(suggestions), entropy
+
+
+def calculate_many(
+    passwords: Iterable[str], processes: int | None = None
+) -> list[tuple[int, list[str], list[str], float]]:
+    if processes is not None and processes < 1:
+        raise ValueError("processes must be at least 1")
+
+    passwords = list(passwords)
+    workers = processes or os.cpu_count() or 1
+    if workers == 1 or len(passwords) < _PARALLEL_MIN_BATCH:
+        return [calculate_score_and_suggestions(p) for p in passwords]
+
+    chunksize = -(-len(passwords) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(calculate_score_and_suggestions, passwords, chunksize=chunksize))
@@ -1,4 +1,9 @@
+from pathlib import Path
+
+import pytest
+
 import password_checker as pc
+from passcheck import calculate_many, calculate_score_and_suggestions, core
 
 
 def test_empty_password_score_zero():
@@ -29,3 +34,209 @@ def test_repeat_penalty_applies():
     score_rep, *_ = pc.calculate_score_and_suggestions("AAAA1111!!!!")
     score_no_rep, *_ = pc.calculate_score_and_suggestions("AAAB1112!!!?")
     assert score_rep < score_no_rep
+
+
+def test_common_words_loaded_once(tmp_path):
+    wordlist = tmp_path / "words.txt"
+    wordlist.write_text("# comment\nDragon\n\nsunshine\n", encoding="utf-8")
+    first = pc.load_common_words(str(wordlist))
+    wordlist.write_text("changed\n", encoding="utf-8")
+    assert pc.load_common_words(str(wordlist)) is first
+    assert first == {"dragon", "sunshine"}
+
+
+def test_dictionary_hits_overlapping_words():
+    words = {"sunshine", "shine", "hine", "dragon", "drag"}
+    hits = pc.find_dictionary_hits("xSunShineDragonx", words)
+    assert sorted(hits) == sorted(words)
+    assert hits[0] == "sunshine"
+
+
+def test_entropy_accepts_precomputed_classes():
+    password = "Abc123!?"
+    classes = pc._classify(password)
+    assert classes == (True, True, True, True)
+    assert pc.estimate_entropy_bits(password, classes) == pc.estimate_entropy_bits(password)
+
+
+def test_score_cache_returns_fresh_lists(monkeypatch):
+    first = pc.calculate_score_and_suggestions("Sunshine2024")
+    first[1].append("mutated")
+    assert pc.calculate_score_and_suggestions("Sunshine2024") == pc._calculate_score_and_suggestions(
+        "Sunshine2024"
+    )
+
+    def fail(password):
+        raise AssertionError("cached password was scored again")
+
+    monkeypatch.setattr(pc, "_calculate_score_and_suggestions", fail)
+    second = pc.calculate_score_and_suggestions("Sunshine2024")
+    assert "mutated" not in second[1]
+
+
+def test_dictionary_hits_accepts_any_iterable():
+    words = ["password", "admin", "pass"]
+    expected = pc.find_dictionary_hits("Adm1nPassword!", set(words))
+    assert pc.find_dictionary_hits("Adm1nPassword!", words) == expected
+    assert expected == ["password", "admin", "pass"]
+
+
+def test_calculate_many_matches_single_calls(monkeypatch):
+    passwords = ["", "Sunshine2024", "AAAA1111!!!!", "correct horse battery staple"]
+    expected = [calculate_score_and_suggestions(p) for p in passwords]
+    assert calculate_many(passwords) == expected
+
+    monkeypatch.setattr(core, "_PARALLEL_MIN_BATCH", 1)
+    assert calculate_many(passwords, processes=2) == expected
+
+
+def test_strength_label_boundaries():
+    assert [pc.strength_label(s) for s in (0, 29, 30, 49, 50, 69, 70, 100)] == [
+        "VERY WEAK", "VERY WEAK", "WEAK", "WEAK", "OKAY", "OKAY", "STRONG", "STRONG",
+    ]
+
+
+def test_missing_wordlist_cached_and_skipped_for_short_input(tmp_path, monkeypatch):
+    missing = str(tmp_path / "missing.txt")
+    assert pc.load_common_words(missing) == frozenset()
+    assert pc.load_common_words(missing) is pc.load_common_words(missing)
+
+    def fail():
+        raise AssertionError("word list loaded for a password too short to match")
+
+    automaton = pc._load_automaton(missing)
+    assert pc._load_automaton(missing) is automaton
+    assert pc._match_words("password", automaton) == []
+
+    monkeypatch.setattr(pc, "_load_automaton", fail)
+    score, findings, suggestions, entropy = pc._calculate_score_and_suggestions("aB3")
+    assert score == 35
+    assert findings == [
+        "Too short (< 8 characters).",
+        "Character types used: 3/4.",
+        "Low estimated entropy (~17.9 bits).",
+    ]
+
+
+def test_common_words_parsing(tmp_path):
+    wordlist = tmp_path / "words.txt"
+    wordlist.write_bytes(b"Dragon\r\n  # indented comment\r\n\t Monkey \r\n\r\nshadow")
+    assert pc.load_common_words(str(wordlist)) == {"dragon", "monkey", "shadow"}
+
+
+def test_automaton_overlapping_and_nested_words():
+    words = {"sunshine", "shine", "hine", "sun", "dragon", "drag", "ragon"}
+    hits = pc._match_words("xsunshinedragonx", pc._build_automaton(words))
+    assert sorted(hits) == sorted(w for w in words if len(w) >= 4)
+    assert hits[0] == "sunshine"
+
+
+def test_automaton_follows_failure_links():
+    words = {"abcabd", "cabd", "bcab", "zzzz"}
+    hits = pc._match_words("abcabcabd", pc._build_automaton(words))
+    assert sorted(hits) == ["abcabd", "bcab", "cabd"]
+
+
+def test_automaton_leetspeak_and_unicode():
+    automaton = pc._build_automaton({"password", "dragon", "café"})
+    assert pc._match_words("p@ssw0rd!", automaton) == ["password"]
+    assert pc._match_words("dr4g0n", automaton) == ["dragon"]
+    assert pc._match_words("moncafé1", automaton) == ["café"]
+    assert pc._match_words("zzzz", automaton) == []
+
+
+def test_score_reports_bundled_word(monkeypatch):
+    bundled = Path(pc.__file__).resolve().parent / "common_words.txt"
+    automaton = pc._build_automaton(pc._read_common_words(str(bundled)))
+    monkeypatch.setattr(pc, "_load_automaton", lambda: automaton)
+
+    score, findings, *_ = pc._calculate_score_and_suggestions("Dragon!2024")
+    assert "Contains common word(s): dragon." in findings
+    assert score < pc._calculate_score_and_suggestions("Xqzvwk!2024")[0]
+
+
+def test_simple_sequence_directions_and_case():
+    assert pc.has_simple_sequence("xdcbax")
+    assert pc.has_simple_sequence("!4321!")
+    assert pc.has_simple_sequence("aBcD")
+    assert not pc.has_simple_sequence("abdc")
+    assert not pc.has_simple_sequence("1357")
+
+
+def test_simple_sequence_min_len():
+    assert pc.has_simple_sequence("ab", 2)
+    assert not pc.has_simple_sequence("ac", 2)
+    assert pc.has_simple_sequence("xyz", 3)
+    assert not pc.has_simple_sequence("xy!", 3)
+    assert pc.has_simple_sequence("abcde", 5)
+    assert not pc.has_simple_sequence("abcd", 5)
+    assert pc.has_simple_sequence("a", 1)
+    assert not pc.has_simple_sequence("", 1)
+    assert pc.has_simple_sequence("", 0)
+
+
+def test_simple_sequence_non_ascii():
+    assert pc.has_simple_sequence("αβγδ")
+    assert pc.has_simple_sequence("ΔΓΒΑ")
+    assert not pc.has_simple_sequence("αβγε")
+
+
+def test_repeated_run_lengths_and_newlines():
+    assert pc.has_repeated_run("xaa", 2)
+    assert not pc.has_repeated_run("abab", 2)
+    assert pc.has_repeated_run("aaaaa", 5)
+    assert not pc.has_repeated_run("aaaa", 5)
+    assert not pc.has_repeated_run("aAaA")
+    assert pc.has_repeated_run("x\n\n\n\n")
+    assert pc.has_repeated_run("é\n\n\n\n")
+    assert pc.has_repeated_run("éééé")
+    assert not pc.has_repeated_run("ééé")
+
+
+@pytest.mark.parametrize("processes", [0, -1])
+def test_calculate_many_rejects_invalid_process_count(processes):
+    with pytest.raises(ValueError):
+        calculate_many(["Sunshine2024"], processes=processes)
+
+
+@pytest.mark.parametrize("password", ["Éé1!", "αΒ", "١٢٣", "中文", "ⓐ", "Ünïcödé Pass ٣!"])
+def test_classify_non_ascii_matches_str_methods(password):
+    expected = (
+        any(c.islower() for c in password),
+        any(c.isupper() for c in password),
+        any(c.isdigit() for c in password),
+        any(not c.isalnum() for c in password),
+    )
+    assert pc._classify(password) == expected
+
+
+def test_common_words_follow_current_directory(tmp_path, monkeypatch):
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    (second / "common_words.txt").write_text("sunshine\n", encoding="utf-8")
+
+    monkeypatch.chdir(first)
+    assert pc.load_common_words() == frozenset()
+    monkeypatch.chdir(second)
+    assert pc.load_common_words() == {"sunshine"}
+
+
+def test_automaton_follows_current_directory(tmp_path, monkeypatch):
+    (tmp_path / "common_words.txt").write_text("sunshine\n", encoding="utf-8")
+
+    monkeypatch.chdir(tmp_path.parent)
+    assert pc._match_words("sunshine", pc._load_automaton()) == []
+    monkeypatch.chdir(tmp_path)
+    assert pc._match_words("sunshine", pc._load_automaton()) == ["sunshine"]
+
+
+def test_score_cache_is_per_word_list(tmp_path, monkeypatch):
+    (tmp_path / "common_words.txt").write_text("zebra\n", encoding="utf-8")
+
+    monkeypatch.chdir(tmp_path.parent)
+    _, findings, *_ = pc.calculate_score_and_suggestions("Zebra!2024x")
+    assert not any("zebra" in f for f in findings)
+    monkeypatch.chdir(tmp_path)
+    _, findings, *_ = pc.calculate_score_and_suggestions("Zebra!2024x")
+    assert "Contains common word(s): zebra." in findings